@@ -9,7 +9,7 @@ import numpy as np
 import scipy.constants as sc
 
 # project
-from payload_designer.libs import physlib, utillib
+from payload_designer.libs import _grism_numba, physlib, utillib
 
 LOG = logging.getLogger(__name__)
 
@@ -69,7 +69,7 @@ class SRGrating:
         # region unit conversions
         G = G * 10 ** 3  # 1/mm to 1/m
         lmda = lmda * 10 ** (-9)  # nm to m
-        alpha = np.radians(alpha)  # deg to rad
+        alpha = np.deg2rad(alpha)  # deg to rad
         # endregion
 
         beta = np.arcsin(G * m * lmda - np.sin(alpha))
@@ -94,7 +94,7 @@ class SRGrating:
         # endregion
 
         # region unit conversions
-        alpha = np.radians(alpha)  # deg to rad
+        alpha = np.deg2rad(alpha)  # deg to rad
         lmda = lmda * 10 ** (-9)  # nm to m
         # endregion
 
@@ -122,8 +122,8 @@ class SRGrating:
         # endregion
 
         # region unit conversions
-        alpha = np.radians(alpha)  # deg to rad
-        beta = np.radians(beta)  # deg to rad
+        alpha = np.deg2rad(alpha)  # deg to rad
+        beta = np.deg2rad(beta)  # deg to rad
         lmda = lmda * 10 ** (-9)  # nm to m
         W = W * 10 ** (-9)  # nm to m
         # endregion
@@ -148,7 +148,7 @@ class SRGrating:
         # endregion
 
         # region unit conversions
-        alpha = np.radians(alpha)  # deg to rad
+        alpha = np.deg2rad(alpha)  # deg to rad
         # endregion
 
         b_to_a = np.cos(beta) / np.cos(alpha)
@@ -224,7 +224,7 @@ class VPHGrating:
         # endregion
 
         # region unit conversions
-        a_0 = np.radians(a_0)  # deg to rad
+        a_0 = np.deg2rad(a_0)  # deg to rad
         Lmda = Lmda * 10 ** (-3)  # mm to m
         lmda = lmda * 10 ** (-9)  # nm to m
         # endregion
@@ -376,13 +376,143 @@ class VPHGrism:
         self.v = v
         self.w = w
 
+        self._rays_params = None
+        self._rays = None
+
+    # the ray parameters of get_angle_out are memoized on their identity, so in-place
+    # edits must not be possible
+    @property
+    def a_in(self):
+        """float: incident ray angle in degrees. Arrays are stored as read-only copies, so
+        assign a new array to change it."""
+        return self._a_in
+
+    @a_in.setter
+    def a_in(self, a_in):
+        self._a_in = utillib.frozen_copy(a_in)
+
+    @property
+    def m(self):
+        """int: diffraction order. Arrays are stored as read-only copies, so
+        assign a new array to change it."""
+        return self._m
+
+    @m.setter
+    def m(self, m):
+        self._m = utillib.frozen_copy(m)
+
+    @property
+    def n_1(self):
+        """float: external index of refraction. Arrays are stored as read-only copies, so
+        assign a new array to change it."""
+        return self._n_1
+
+    @n_1.setter
+    def n_1(self, n_1):
+        self._n_1 = utillib.frozen_copy(n_1)
+
+    @property
+    def n_2(self):
+        """float: prism index of refraction. Arrays are stored as read-only copies, so
+        assign a new array to change it."""
+        return self._n_2
+
+    @n_2.setter
+    def n_2(self, n_2):
+        self._n_2 = utillib.frozen_copy(n_2)
+
+    @property
+    def n_3(self):
+        """float: grating substrate index of refraction. Arrays are stored as read-only copies, so
+        assign a new array to change it."""
+        return self._n_3
+
+    @n_3.setter
+    def n_3(self, n_3):
+        self._n_3 = utillib.frozen_copy(n_3)
+
+    @property
+    def v(self):
+        """float: fringe frequency in lines/mm. Arrays are stored as read-only copies, so
+        assign a new array to change it."""
+        return self._v
+
+    @v.setter
+    def v(self, v):
+        self._v = utillib.frozen_copy(v)
+
+    @property
+    def l(self):
+        """array_like[float]: wavelength in nm. Arrays are stored as read-only
+        copies, so assign a new array to change it."""
+        return self._l
+
+    @l.setter
+    def l(self, l):
+        self._l = utillib.frozen_copy(l)
+        self._l_m = None if l is None else self._l * 10 ** -9  # nm to m
+
+    @property
+    def a(self):
+        """float: apex angle in degrees. Arrays are stored as read-only copies, so
+        assign a new array to change it."""
+        return self._a
+
+    @a.setter
+    def a(self, a):
+        # the apex angle is fixed for a given grism, so its radian form and
+        # trigonometric ratios are only computed when it is set
+        self._a = utillib.frozen_copy(a)
+        if a is None:
+            self._a_rad = self._sin_a = self._cos_a = None
+        else:
+            self._a_rad = np.deg2rad(self._a)
+            self._sin_a = np.sin(self._a_rad)
+            self._cos_a = np.cos(self._a_rad)
+
     def get_angle_out(self):
         """Calculates the outgoing angle from the grism.
 
+        All parameters other than l are broadcast against each other along the
+        ray axis, l spans the wavelength axis.
+
         Returns:
-            float: outgoing angle in degrees.
+            array_like[float]: outgoing angle in degrees, shape (rays, wavelengths).
 
         """
+        assert self.l is not None, "l is not set."
+
+        a_in, n_1, n_2, n_3, m, a, v = self._get_rays()
+
+        # region vectorization
+        l = np.ravel(self._l_m)
+        # endregion
+
+        angle_out = _grism_numba.grism_angle_out(a_in, n_1, n_2, n_3, m, a, v, l)
+
+        angle_out = np.rad2deg(angle_out, out=angle_out)
+
+        return angle_out
+
+    def _get_rays(self):
+        """Broadcasts and converts the per-ray parameters of get_angle_out.
+
+        The result is memoized on the identity of the parameters, so sweeps that only
+        change l skip this step. The parameters are stored read-only, so they can only
+        change by reassignment.
+
+        Returns:
+            tuple[ndarray]: a_in [rad], n_1, n_2, n_3, m, a [rad] and v, each of
+                shape (rays,).
+
+        """
+        params = (self.a_in, self.n_1, self.n_2, self.n_3, self.m, self._a_rad, self.v)
+
+        if self._rays_params is not None and all(
+            x is y for x, y in zip(params, self._rays_params)
+        ):
+            return self._rays
+
         assert self.a_in is not None, "a_in is not set."
         assert self.n_1 is not None, "n_1 is not set."
         assert self.n_2 is not None, "n_2 is not set."
@@ -390,40 +520,24 @@ class VPHGrism:
         assert self.m is not None, "m is not set."
         assert self.a is not None, "a is not set."
         assert self.v is not None, "v is not set."
-        assert self.l is not None, "l is not set."
 
         # region vectorization
-        a_in = np.array(self.a_in).reshape(-1, 1)
-        n_1 = np.array(self.n_1).reshape(-1, 1)
-        n_2 = np.array(self.n_2).reshape(-1, 1)
-        n_3 = np.array(self.n_3).reshape(-1, 1)
-        m = np.array(self.m).reshape(-1, 1)
-        a = np.array(self.a).reshape(-1, 1)
-        v = np.array(self.v).reshape(-1, 1)
-        l = np.array(self.l).reshape(-1, 1)
+        a_in, n_1, n_2, n_3, m, a, v = (
+            np.array(x, dtype=np.float64)
+            for x in np.broadcast_arrays(*map(np.ravel, params))
+        )
+        m = m.astype(np.int64)
         # endregion
 
         # region unit conversions
-        l = l * 10 ** -9  # m to nm
-        a_in = np.radians(a_in)  # deg to rad
-        a = np.radians(self.a)  # deg to rad
+        a_in = np.deg2rad(a_in, out=a_in)  # deg to rad
         # endregion
 
-        angle_1 = a_in + a
-        angle_2 = physlib.snell_angle_2(angle_1=angle_1, n_1=n_1, n_2=n_2)
-        angle_3 = a - angle_2
-        angle_4 = physlib.snell_angle_2(angle_1=angle_3, n_1=n_2, n_2=n_3)
-        angle_5 = angle_4
-        angle_6 = np.arcsin(np.sin(angle_5) - m * np.matmul(v, np.transpose(l)))
-        angle_7 = angle_6
-        angle_8 = physlib.snell_angle_2(angle_1=angle_7, n_1=n_3, n_2=n_2)
-        angle_9 = angle_8 - a
-        angle_10 = physlib.snell_angle_2(angle_1=angle_9, n_1=n_2, n_2=n_1)
-        angle_out = angle_10 + a
+        # holding on to params keeps their ids from being reused
+        self._rays_params = params
+        self._rays = (a_in, n_1, n_2, n_3, m, a, v)
 
-        angle_out = np.degrees(angle_out)
-
-        return angle_out
+        return self._rays
 
     def get_undeviated_wavelength(self):
         """Calculates the grism undeviated wavelength.
@@ -443,16 +557,17 @@ class VPHGrism:
         assert self.n_2 is not None, "n_2 is not set"
         assert self.n_3 is not None, "n_3 is not set"
         # unit conversions
-        a_in = np.radians(self.a_in)  # deg to rad
-        a = np.radians(self.a)
+        a_in = np.deg2rad(self.a_in)  # deg to rad
+        a = self._a_rad
         v = self.v * 10 ** -6  # lines/mm to lines/nm
 
-        angle_1 = a_in + a
-        angle_2 = physlib.snell_angle_2(angle_1=angle_1, n_1=self.n_1, n_2=self.n_2)
-        angle_3 = a - angle_2
-        angle_4 = physlib.snell_angle_2(angle_1=angle_3, n_1=self.n_2, n_2=self.n_3)
-        angle_5 = angle_4
-        l_g = 2 * (np.sin(angle_5) / (self.m * v))
+        sin_1 = np.sin(a_in + a)
+        sin_2 = physlib.snell_sin_2(sin_1=sin_1, n_1=self.n_1, n_2=self.n_2)
+        # sin(a - angle_2) from sin(angle_2)
+        sin_3 = self._sin_a * np.sqrt(1 - sin_2 ** 2) - self._cos_a * sin_2
+        sin_4 = physlib.snell_sin_2(sin_1=sin_3, n_1=self.n_2, n_2=self.n_3)
+        sin_5 = sin_4
+        l_g = 2 * (sin_5 / (self.m * v))
         return l_g  # in nm
 
     def get_resolvance(self):
@@ -508,7 +623,7 @@ class VPHGrism:
         ):
 
             # region unit conversion
-            lmbda = self.l * 1e-9  # [nm] to [m]
+            lmbda = self._l_m  # [m]
             v = self.v * 1e3  # [L/mm] to [L/m]
             w = self.w * 1e-3  # [mm] to [m]
             # endregion
@@ -564,17 +679,20 @@ class VPHGrism:
         # vectorization
 
         # unit conversion
-        a_in = np.radians(self.a_in)
-        a = np.radians(self.a)
+        a_in = np.deg2rad(self.a_in)
+        a = self._a_rad
         l = self.l  # nm
         v = self.v * 10 ** -6  # lines/mm to lines/nm
         d = self.d * 10 ** 3  # microns to nm
 
-        angle_1 = a_in + a
-        angle_2 = physlib.snell_angle_2(angle_1=angle_1, n_1=self.n_1, n_2=self.n_2)
-        angle_3 = a - angle_2
-        angle_4 = physlib.snell_angle_2(angle_1=angle_3, n_1=self.n_2, n_2=self.n_3)
-        angle_5 = angle_4
+        sin_1 = np.sin(a_in + a)
+        sin_2 = physlib.snell_sin_2(sin_1=sin_1, n_1=self.n_1, n_2=self.n_2)
+        # sin(a - angle_2) from sin(angle_2)
+        sin_3 = self._sin_a * np.sqrt(1 - sin_2 ** 2) - self._cos_a * sin_2
+        sin_4 = physlib.snell_sin_2(sin_1=sin_3, n_1=self.n_2, n_2=self.n_3)
+        sin_5 = sin_4
+        cos_5 = np.sqrt(1 - sin_5 ** 2)
+        cos_2x5 = 1 - 2 * sin_5 ** 2  # cos(2 * angle_5)
         L = 1 / v  # nm/lines
 
         Q = (l ** 2) / (self.n_g * self.n_3 * L ** 2)
@@ -583,15 +701,8 @@ class VPHGrism:
                 "Q requirement not met, diffraction efficiency formula not valid"
             )
         # diffraction efficiency
-        n_p = (np.sin((math.pi * self.n_g * d) / (l * np.cos(angle_5))) ** 2) + (
-            (1 / 2)
-            * (
-                np.sin(
-                    ((math.pi * self.n_g * d) * np.cos(2 * angle_5))
-                    / (l * np.cos(angle_5))
-                )
-            )
-            ** 2
+        n_p = (np.sin((math.pi * self.n_g * d) / (l * cos_5)) ** 2) + (
+            (1 / 2) * (np.sin(((math.pi * self.n_g * d) * cos_2x5) / (l * cos_5))) ** 2
         )  # angle_5 being close to bragg angle = more efficiency
         n_p = n_p * self.eff_mat * self.eff_mat
         return n_p
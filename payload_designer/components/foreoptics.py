@@ -66,13 +66,11 @@ class Foreoptic:
         assert self.ds_i is not None, "ds_i is not set."
 
         if self.n is not None:
-            dm_a = np.divide(self.ds_i, self.n)
-        elif self.na is not None:
-            dm_a = 2 * np.multiply(self.ds_i, self.na)
-        else:
-            raise ValueError("n or na must be set.")
+            return self.ds_i / self.n
+        if self.na is not None:
+            return 2 * self.ds_i * self.na
 
-        return dm_a
+        raise ValueError("n or na must be set.")
 
     def get_magnification(self):
         """Calculate the magnification of the foreoptics.
@@ -84,7 +82,7 @@ class Foreoptic:
         assert self.ds_i is not None, "ds_i is not set."
         assert self.ds_o is not None, "ds_o is not set."
 
-        m = np.divide(self.ds_i, self.ds_o)
+        m = self.ds_i / self.ds_o
 
         return m
 
@@ -96,13 +94,11 @@ class Foreoptic:
 
         """
         if self.na is not None:
-            n = np.divide(1, 2 * self.na)
-        elif self.ds_i is not None and self.dm_a is not None:
-            n = np.divide(self.ds_i, self.dm_a)
-        else:
-            raise ValueError("ds_i and dm_a or na must be set.")
+            return 1 / (2 * self.na)
+        if self.ds_i is not None and self.dm_a is not None:
+            return self.ds_i / self.dm_a
 
-        return n
+        raise ValueError("ds_i and dm_a or na must be set.")
 
     def get_effective_focal_length(self):
         """Calculate the effective focal length.
@@ -114,7 +110,7 @@ class Foreoptic:
         assert self.ds_i is not None, "ds_i is not set."
         assert self.ds_o is not None, "ds_o is not set."
 
-        efl = np.divide(self.ds_o + self.ds_i, np.multiply(self.ds_o, self.ds_i))
+        efl = (self.ds_o + self.ds_i) / (self.ds_o * self.ds_i)
 
         return efl
 
@@ -125,19 +121,17 @@ class Foreoptic:
             float: numerical aperture (unitless).
 
         """
+        if self.a_in_max is not None:
 
-        # region unit conversions
-        a_in_max = np.radians(self.a_in_max)  # deg to rad
-        # endregion
+            # region unit conversions
+            a_in_max = np.radians(self.a_in_max)  # deg to rad
+            # endregion
 
-        if a_in_max is not None:
-            na = np.sin(a_in_max)
-        elif self.n is not None:
-            na = np.divide(1, 2 * self.n)
-        else:
-            raise ValueError("a_in_max or n must be set.")
+            return np.sin(a_in_max)
+        if self.n is not None:
+            return 1 / (2 * self.n)
 
-        return na
+        raise ValueError("a_in_max or n must be set.")
 
     def get_geometric_etendue(self):
         """Calculate the geometric etendue.
@@ -153,7 +147,7 @@ class Foreoptic:
         a_in_max = np.radians(self.a_in_max)  # deg to rad
         # endregion
 
-        g = np.multiply(np.pi, np.multiply(self.s, np.power(np.sin(a_in_max), 2)))
+        g = np.pi * self.s * np.sin(a_in_max) ** 2
 
         return g
 
@@ -167,6 +161,6 @@ class Foreoptic:
         assert self.b is not None, "b is not set."
         assert self.g is not None, "g is not set."
 
-        f = np.multiply(self.b, self.g)
+        f = self.b * self.g
 
         return f
@@ -9,11 +9,34 @@ import numpy as np
 import scipy.constants as sc
 
 # project
-from payload_designer.libs import physlib, utillib
+from payload_designer.libs import _lens_numba, physlib, utillib
 
 LOG = logging.getLogger(__name__)
 
 
+def _to_columns(component, names):
+    """Broadcasts the set parameters of a component to 1D float arrays of a common
+    length, in place.
+
+    Args:
+        component (object): component instance.
+        names (list[str]): names of the design parameters.
+
+    Returns:
+        int: number of designs.
+
+    """
+    names = [name for name in names if getattr(component, name) is not None]
+    columns = np.broadcast_arrays(
+        *(np.ravel(getattr(component, name)).astype(np.float64) for name in names)
+    )
+
+    for name, column in zip(names, columns):
+        setattr(component, name, column)
+
+    return columns[0].size if columns else 0
+
+
 class ThinLens:
     """Thin singlet lens component.
 
@@ -92,15 +115,15 @@ class ThinLens:
         assert self.a_in is not None, "a_in is not set."
 
         # region vectorization
-        f = np.array(self.f).reshape(-1, 1)
-        a_in = np.array(self.a_in).reshape(-1, 1)
+        f = np.ravel(self.f)
+        a_in = np.ravel(self.a_in)
         # endregion
 
         # region unit conversions
         a_in = np.radians(a_in)  # deg to rad
         # endregion
 
-        h_i = np.matmul(f, np.transpose(np.tan(a_in)))
+        h_i = np.multiply.outer(f, np.tan(a_in))
 
         return h_i
 
@@ -115,15 +138,15 @@ class ThinLens:
         assert self.a_out is not None, "a_out is not set."
 
         # region vectorization
-        f = np.array(self.f).reshape(-1, 1)
-        a_out = np.array(self.a_out).reshape(-1, 1)
+        f = np.ravel(self.f)
+        a_out = np.ravel(self.a_out)
         # endregion
 
         # region unit conversions
         a_out = np.radians(a_out)  # deg to rad
         # endregion
 
-        h_o = np.matmul(f, np.transpose(np.tan(a_out)))
+        h_o = np.multiply.outer(f, np.tan(a_out))
 
         return h_o
 
@@ -234,9 +257,7 @@ class ThickLens:
         assert self.R2 is not None, "R2 is not set."
         assert self.d is not None, "d is not set."
 
-        f_thick = (self.n * self.R1 * self.R2) / (
-            (self.R2 - self.R1) * (self.n - 1) * self.n + ((self.n - 1) ** 2) * self.d
-        )
+        f_thick = _lens_numba.thick_focal_length(self.n, self.R1, self.R2, self.d)
 
         return f_thick
 
@@ -255,8 +276,8 @@ class ThickLens:
         assert self.R2 is not None, "R2 is not set."
         assert self.f_thick is not None, "f_thick is not set."
 
-        h1 = -(self.f_thick * (self.n - 1) * self.d) / (self.R2 * self.n)
-        h2 = -(self.f_thick * (self.n - 1) * self.d) / (self.R1 * self.n)
+        h1 = _lens_numba.thick_principal_plane(self.f_thick, self.n, self.d, self.R2)
+        h2 = _lens_numba.thick_principal_plane(self.f_thick, self.n, self.d, self.R1)
 
         return h1, h2
 
@@ -321,6 +342,39 @@ class ThickLens:
         return np.degrees(a2)
 
 
+class ThickLensBatch(ThickLens):
+    """Batch of thick singlet lens designs.
+
+    Each parameter is stored as a column of shape (N,), so every method evaluates all
+    N designs in one vectorized call instead of one ThickLens instance per design.
+
+    Args:
+        Same as ThickLens, as array_like[float] of length N or as a float shared by
+        all designs.
+
+    """
+
+    PARAMETERS = [
+        "h1",
+        "h2",
+        "f_thick",
+        "n",
+        "d",
+        "R1",
+        "R2",
+        "s_i",
+        "s_o",
+        "a1",
+        "a2",
+        "x1",
+        "x2",
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.N = _to_columns(self, self.PARAMETERS)
+
+
 class AchromLens:
     """Achromatic doublet component.
 
@@ -350,16 +404,46 @@ class AchromLens:
         self.f_2 = f_2
         self.f_eq = f_eq
 
+    # focal lengths are given in mm and also stored in m when set
+    @property
+    def f_1(self):
+        """float: focal length of first element (mm). Arrays are stored as read-only
+        copies, so assign a new array to change it."""
+        return self._f_1
+
+    @f_1.setter
+    def f_1(self, f_1):
+        self._f_1 = utillib.frozen_copy(f_1)
+        self._f_1_m = None if f_1 is None else self._f_1 * 10 ** -3  # mm to m
+
+    @property
+    def f_2(self):
+        """float: focal length of second element (mm). Arrays are stored as read-only
+        copies, so assign a new array to change it."""
+        return self._f_2
+
+    @f_2.setter
+    def f_2(self, f_2):
+        self._f_2 = utillib.frozen_copy(f_2)
+        self._f_2_m = None if f_2 is None else self._f_2 * 10 ** -3  # mm to m
+
+    @property
+    def f_eq(self):
+        """float: effective focal length of system (mm). Arrays are stored as read-only
+        copies, so assign a new array to change it."""
+        return self._f_eq
+
+    @f_eq.setter
+    def f_eq(self, f_eq):
+        self._f_eq = utillib.frozen_copy(f_eq)
+        self._f_eq_m = None if f_eq is None else self._f_eq * 10 ** -3  # mm to m
+
     def focal_length_1(self):
         assert self.V_1 is not None, "V_1 is not set."
         assert self.V_2 is not None, "V_2 is not set."
         assert self.f_eq is not None, "f_eq is not set."
 
-        # region unit conversions
-        f_eq = self.f_eq * 10 ** -3  # mm to m
-        # endregion
-
-        f_1 = f_eq * (self.V_1 - self.V_2) / self.V_1
+        f_1 = _lens_numba.achrom_focal_length_1(self._f_eq_m, self.V_1, self.V_2)
         return f_1
 
     def focal_length_2(self):
@@ -367,25 +451,39 @@ class AchromLens:
         assert self.V_2 is not None, "V_2 is not set."
         assert self.f_eq is not None, "f_eq is not set."
 
-        # region unit conversions
-        f_eq = self.f_eq * 10 ** -3  # mm to m
-        # endregion
-
-        f_2 = -f_eq * (self.V_1 - self.V_2) / self.V_2
+        f_2 = _lens_numba.achrom_focal_length_2(self._f_eq_m, self.V_1, self.V_2)
         return f_2
 
     def effective_focal_length(self):
 
-        # region unit conversions
-        f_1 = self.f_1 * 10 ** -3  # mm to m
-        f_2 = self.f_2 * 10 ** -3  # mm to m
-        # endregion
-
-        if f_1 is not None:
-            f_eq = f_1 * self.V_1 / (self.V_1 - self.V_2)
-        elif f_2 is not None:
-            f_eq = -f_2 * self.V_2 / (self.V_1 - self.V_2)
+        if self.f_1 is not None:
+            f_eq = _lens_numba.achrom_effective_focal_length_1(
+                self._f_1_m, self.V_1, self.V_2
+            )
+        elif self.f_2 is not None:
+            f_eq = _lens_numba.achrom_effective_focal_length_2(
+                self._f_2_m, self.V_1, self.V_2
+            )
         else:
             raise ValueError("f_1 or f_2 must be set.")
 
         return f_eq
+
+
+class AchromLensBatch(AchromLens):
+    """Batch of achromatic doublet designs.
+
+    Each parameter is stored as a column of shape (N,), so every method evaluates all
+    N designs in one vectorized call instead of one AchromLens instance per design.
+
+    Args:
+        Same as AchromLens, as array_like[float] of length N or as a float shared by
+        all designs.
+
+    """
+
+    PARAMETERS = ["V_1", "V_2", "f_1", "f_2", "f_eq"]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.N = _to_columns(self, self.PARAMETERS)
@@ -62,9 +62,12 @@ class Slit:
         assert self.l_s is not None, "l_s is not set."
         assert self.f is not None, "f is not set."
 
-        fov_h = 2 * np.arctan(np.divide(self.l_s, 2 * self.f))
+        if np.isscalar(self.l_s) and np.isscalar(self.f):
+            return math.degrees(2 * math.atan(self.l_s / (2 * self.f)))
 
-        return np.divide(np.multiply(fov_h, 180), np.pi)
+        fov_h = 2 * np.arctan(self.l_s / (2 * self.f))
+
+        return np.rad2deg(fov_h)
 
     def get_vertical_field_of_view(self):
         """Caculates the vertical field of view.
@@ -76,9 +79,12 @@ class Slit:
         assert self.w_s is not None, "w_s is not set."
         assert self.f is not None, "f is not set."
 
-        fov_v = 2 * np.arctan(np.divide(self.w_s, 2 * self.f))
+        if np.isscalar(self.w_s) and np.isscalar(self.f):
+            return math.degrees(2 * math.atan(self.w_s / (2 * self.f)))
+
+        fov_v = 2 * np.arctan(self.w_s / (2 * self.f))
 
-        return np.divide(np.multiply(fov_v, 180), np.pi)
+        return np.rad2deg(fov_v)
 
     def get_image_width(self):
         """Caculates the image width.
@@ -91,10 +97,7 @@ class Slit:
         assert self.w_s is not None, "w_s is not set."
         assert self.w_o is not None, "w_o is not set."
 
-        w_i = np.sqrt(
-            np.multiply(np.power(self.m, 2), np.power(self.w_s, 2))
-            + np.power(self.w_o, 2)
-        )
+        w_i = np.hypot(self.m * self.w_s, self.w_o)
 
         return w_i
 
@@ -108,6 +111,6 @@ class Slit:
         assert self.m is not None, "m is not set."
         assert self.w_d is not None, "w_d is not set."
 
-        w_s = np.divide(self.w_d, self.m)
+        w_s = self.w_d / self.m
 
         return w_s
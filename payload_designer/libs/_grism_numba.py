@@ -0,0 +1,66 @@
+"""Compiled kernels for the VPH grism ray trace."""
+
+# stdlib
+import math
+
+# external
+import numpy as np
+from numba import njit, prange
+
+# NaN must survive the kernel to flag rays that do not make it through the grism,
+# so the "nnan" and "ninf" fast-math flags are left out.
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+# compiled on first call rather than at import, which would start the thread pool
+@njit(cache=True, fastmath=FASTMATH, parallel=True)
+def grism_angle_out(a_in, n1, n2, n3, m, apex, v, l):
+    """Traces rays through a VPH grism and returns their outgoing angle.
+
+    The refraction chain is carried in the sine domain so that only the last
+    interface needs an arcsin.
+
+    Args:
+        a_in (ndarray[float]): incident ray angle [rad], shape (rays,).
+        n1 (ndarray[float]): external index of refraction, shape (rays,).
+        n2 (ndarray[float]): prism index of refraction, shape (rays,).
+        n3 (ndarray[float]): grating substrate index of refraction, shape (rays,).
+        m (ndarray[int]): diffraction order, shape (rays,).
+        apex (ndarray[float]): prism apex angle [rad], shape (rays,).
+        v (ndarray[float]): fringe frequency, shape (rays,).
+        l (ndarray[float]): wavelength [m], shape (wavelengths,).
+
+    Returns:
+        ndarray[float]: outgoing angle [rad], shape (rays, wavelengths). NaN where
+            the ray is totally internally reflected or the order is evanescent.
+
+    """
+    N = a_in.size
+    M = l.size
+    angle_out = np.empty((N, M))
+
+    # rays are independent and each writes only its own row of angle_out
+    for i in prange(N):
+        sin_a = math.sin(apex[i])
+        cos_a = math.cos(apex[i])
+        n3_n2 = n3[i] / n2[i]
+        n2_n1 = n2[i] / n1[i]
+        mv = m[i] * v[i]
+
+        # prism entrance
+        sin_2 = n1[i] / n2[i] * math.sin(a_in[i] + apex[i])
+        sin_3 = sin_a * math.sqrt(1 - sin_2 * sin_2) - cos_a * sin_2
+        sin_5 = n2[i] / n3[i] * sin_3
+        if abs(sin_5) > 1:
+            sin_5 = np.nan
+
+        # grating and prism exit, kept branch-free so LLVM can vectorize it
+        for j in range(M):
+            sin_6 = sin_5 - mv * l[j]
+            sin_8 = n3_n2 * sin_6
+            sin_9 = sin_8 * cos_a - math.sqrt(1 - sin_8 * sin_8) * sin_a
+            sin_10 = n2_n1 * sin_9
+            angle = math.asin(sin_10) + apex[i]
+            angle_out[i, j] = angle if abs(sin_6) <= 1 else np.nan
+
+    return angle_out
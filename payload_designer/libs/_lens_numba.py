@@ -0,0 +1,77 @@
+"""Compiled ufuncs for the closed-form lens equations."""
+
+# stdlib
+import functools
+
+# external
+from numba import float64, vectorize
+
+THICK_SIGNATURES = [float64(float64, float64, float64, float64)]
+ACHROM_SIGNATURES = [float64(float64, float64, float64)]
+
+
+def lens_ufunc(signatures):
+    """Compiles a lens equation into a ufunc for array inputs.
+
+    Calls with only Python scalars skip the ufunc, whose dispatch costs more than
+    the arithmetic, and evaluate the equation directly.
+
+    Args:
+        signatures (list[numba.types.Signature]): signatures to compile.
+
+    Returns:
+        callable: decorator.
+
+    """
+
+    def decorator(equation):
+        ufunc = vectorize(signatures, nopython=True, cache=True)(equation)
+
+        @functools.wraps(equation)
+        def dispatch(*args):
+            for arg in args:
+                if not isinstance(arg, (int, float)):
+                    return ufunc(*args)
+
+            return equation(*args)
+
+        return dispatch
+
+    return decorator
+
+
+@lens_ufunc(THICK_SIGNATURES)
+def thick_focal_length(n, R1, R2, d):
+    """Focal length of a thick lens in a vacuum."""
+    return (n * R1 * R2) / ((R2 - R1) * (n - 1) * n + ((n - 1) ** 2) * d)
+
+
+@lens_ufunc(THICK_SIGNATURES)
+def thick_principal_plane(f_thick, n, d, R):
+    """Distance from a thick lens vertex to its principal plane, given the radius
+    of curvature of the opposite surface."""
+    return -(f_thick * (n - 1) * d) / (R * n)
+
+
+@lens_ufunc(ACHROM_SIGNATURES)
+def achrom_focal_length_1(f_eq, V_1, V_2):
+    """Focal length of the first element of an achromatic doublet."""
+    return f_eq * (V_1 - V_2) / V_1
+
+
+@lens_ufunc(ACHROM_SIGNATURES)
+def achrom_focal_length_2(f_eq, V_1, V_2):
+    """Focal length of the second element of an achromatic doublet."""
+    return -f_eq * (V_1 - V_2) / V_2
+
+
+@lens_ufunc(ACHROM_SIGNATURES)
+def achrom_effective_focal_length_1(f_1, V_1, V_2):
+    """Effective focal length of an achromatic doublet from its first element."""
+    return f_1 * V_1 / (V_1 - V_2)
+
+
+@lens_ufunc(ACHROM_SIGNATURES)
+def achrom_effective_focal_length_2(f_2, V_1, V_2):
+    """Effective focal length of an achromatic doublet from its second element."""
+    return -f_2 * V_2 / (V_1 - V_2)
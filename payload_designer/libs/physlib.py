@@ -17,3 +17,26 @@ def snell_angle_2(angle_1, n_1, n_2):
     angle_2 = np.arcsin(n_1 / n_2 * np.sin(angle_1))
 
     return angle_2
+
+
+def snell_sin_2(sin_1, n_1, n_2):
+    """Calculate the sine of the angle of refraction of a ray travelling between
+    two mediums according to Snell's law.
+
+    Working with sines avoids an arcsin/sin round trip when refractions are chained.
+
+    Args:
+        sin_1 (array_like[float]): sine of the angle of incidence with respect to
+            surface normal.
+        n_1 (float): index of refraction in first medium.
+        n_2 (float): index of refraction in second medium.
+
+    Returns:
+        array_like[float]: sine of the angle of refraction, NaN where the ray is
+            totally internally reflected.
+
+    """
+    sin_2 = n_1 / n_2 * sin_1
+    sin_2 = np.where(np.abs(sin_2) <= 1, sin_2, np.nan)[()]  # 0-d result to scalar
+
+    return sin_2
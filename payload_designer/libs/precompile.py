@@ -0,0 +1,50 @@
+"""Ahead-of-time compilation of the Numba kernels.
+
+The kernels cache their machine code on disk next to their modules. Running
+
+    python -m payload_designer.libs.precompile
+
+once after installing fills that cache, so later processes load the kernels instead
+of compiling them on first use.
+
+"""
+
+# stdlib
+import subprocess
+import sys
+
+# external
+import numpy as np
+
+# project
+from payload_designer.libs import _grism_numba, _lens_numba
+
+
+def precompile():
+    """Compiles every kernel and caches it to disk.
+
+    The kernels run in a separate interpreter, so the calling process does not start
+    Numba's thread pool and can still fork workers.
+
+    """
+    subprocess.run([sys.executable, "-m", __name__], check=True)
+
+
+def _warm_up():
+    """Calls every kernel once on single-element inputs of the types the components
+    pass them."""
+    x = np.ones(1)
+    y = 2 * x
+
+    _grism_numba.grism_angle_out(0 * x, x, x, x, np.ones(1, dtype=np.int64), x, x, x)
+
+    _lens_numba.thick_focal_length(y, x, y, x)
+    _lens_numba.thick_principal_plane(x, x, x, x)
+    _lens_numba.achrom_focal_length_1(x, y, x)
+    _lens_numba.achrom_focal_length_2(x, y, x)
+    _lens_numba.achrom_effective_focal_length_1(x, y, x)
+    _lens_numba.achrom_effective_focal_length_2(x, y, x)
+
+
+if __name__ == "__main__":
+    _warm_up()
@@ -1,23 +1,90 @@
 """An assortment of utilities and classes for scientific computing."""
 
+# stdlib
+import functools
+import os
+from pathlib import Path
+
 # external
 import numpy as np
 
 
+def frozen_copy(x):
+    """Copy array-like data into a read-only float array, so that it cannot be
+    modified in place behind values derived from it. Scalars and None are returned
+    unchanged.
+
+    Args:
+        x (array_like[float]): data to copy.
+
+    Returns:
+        array_like[float]: read-only copy of the data.
+
+    """
+    if x is None or np.ndim(x) == 0:
+        return x
+
+    x = np.array(x, dtype=np.float64)
+    x.setflags(write=False)
+
+    return x
+
+
+def _read_lut(fname):
+    """Read LUT data from a csv file.
+
+    Args:
+        fname (path-like, file-like or list[str]): CSV data containing LUT data.
+
+    Returns:
+        tuple[ndarray, ndarray]: x and f(x) data.
+
+    """
+    data = np.genfromtxt(fname=fname, delimiter=",")
+
+    return data[:, 0], data[:, 1]
+
+
+@functools.lru_cache(maxsize=128)
+def _load_lut(path, mtime):
+    """Read LUT data from a csv file, caching the result by file so that repeated
+    LUT instantiations in a sweep only read each file once.
+
+    Args:
+        path (str): The resolved path to the CSV data file containing LUT data.
+        mtime (int): The modification time of the file [ns], so that edits to the
+            file are read again.
+
+    Returns:
+        tuple[ndarray, ndarray]: read-only x and f(x) data.
+
+    """
+    x, y = _read_lut(path)
+    x.setflags(write=False)
+    y.setflags(write=False)
+
+    return x, y
+
+
 class LUT:
     """A lookup table implementation. Initialized from a csv file containing x
     data in the first column, f(x) data in the second column.
 
     Args:
-        path (path-like): The path to the CSV data file containing LUT data.
+        path (path-like): The path to the CSV data file containing LUT data. A
+            file-like object or list of lines is also accepted, but is not cached.
         scale (float): The scale factor to apply to the LUT data.
 
     """
 
     def __init__(self, path, scale=(1, 1)):
-        data = np.genfromtxt(fname=path, delimiter=",")
-        self.x = data[:, 0]
-        self.y = data[:, 1]
+        if isinstance(path, (str, os.PathLike)):
+            path = Path(path).resolve()
+            x, y = _load_lut(os.fspath(path), path.stat().st_mtime_ns)
+        else:
+            x, y = _read_lut(path)
+        self.x = x.copy()
+        self.y = y.copy()
         self.scale(scale[0], scale[1])
 
     def scale(self, scl_x, scl_y):
@@ -1,16 +1,62 @@
 """Tests for VPH Grism component."""
 # stdlib
+import concurrent.futures
 import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
 
 # external
+import numba
 import numpy as np
 import pytest
 
 # project
 from payload_designer.components import diffractors
+from payload_designer.libs import physlib
 
 LOG = logging.getLogger(__name__)
 
+ROOT = Path(__file__).parents[3]
+
+
+def angle_out_reference(a_in, n_1, n_2, n_3, m, a, v, l):
+    """Outgoing grism angle from the arcsin chain of Snell refractions."""
+    a_in, n_1, n_2, n_3, m, a, v = (
+        np.array(x).reshape(-1, 1) for x in (a_in, n_1, n_2, n_3, m, a, v)
+    )
+    l = np.array(l).reshape(1, -1) * 10 ** -9  # nm to m
+    a_in = np.radians(a_in)  # deg to rad
+    a = np.radians(a)  # deg to rad
+
+    with np.errstate(invalid="ignore"):
+        angle_2 = physlib.snell_angle_2(angle_1=a_in + a, n_1=n_1, n_2=n_2)
+        angle_4 = physlib.snell_angle_2(angle_1=a - angle_2, n_1=n_2, n_2=n_3)
+        angle_6 = np.arcsin(np.sin(angle_4) - m * v * l)
+        angle_8 = physlib.snell_angle_2(angle_1=angle_6, n_1=n_3, n_2=n_2)
+        angle_10 = physlib.snell_angle_2(angle_1=angle_8 - a, n_1=n_2, n_2=n_1)
+
+    return np.degrees(angle_10 + a)
+
+
+def get_angle_out(a_in):
+    """Builds a grism for an incident angle and returns its outgoing angles."""
+    grism = diffractors.VPHGrism(
+        a_in=a_in,
+        n_1=1.0,
+        n_2=1.52,
+        n_3=1.3,
+        m=1,
+        a=45,
+        v=np.linspace(start=300, stop=6000, num=10),
+        l=np.linspace(start=1600, stop=1700, num=5),
+    )
+
+    return grism.get_angle_out()
+
 
 def test_get_angle_out():
     """Test VPHGrism.get_angle_out()."""
@@ -35,6 +81,154 @@ def test_get_angle_out():
     # fig.show()
 
 
+def test_get_angle_out_a_in_sweep():
+    """Test VPHGrism.get_angle_out() against the Snell's law arcsin chain over
+    incident angles."""
+    a_in = np.linspace(start=-20, stop=20, num=41)
+    l = np.linspace(start=1600, stop=1700, num=100)
+    params = dict(a_in=a_in, n_1=1.0, n_2=1.52, n_3=1.3, m=1, a=45, v=3e4, l=l)
+
+    angle_out = diffractors.VPHGrism(**params).get_angle_out()
+
+    expected = angle_out_reference(**params)
+    assert not np.isnan(expected).any()
+    np.testing.assert_allclose(angle_out, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_get_angle_out_v_sweep():
+    """Test VPHGrism.get_angle_out() against the Snell's law arcsin chain over
+    fringe frequencies."""
+    v = np.linspace(start=300, stop=5e4, num=50)
+    l = np.linspace(start=1600, stop=1700, num=100)
+    params = dict(a_in=0, n_1=1.0, n_2=1.52, n_3=1.3, m=1, a=45, v=v, l=l)
+
+    angle_out = diffractors.VPHGrism(**params).get_angle_out()
+
+    expected = angle_out_reference(**params)
+    assert not np.isnan(expected).any()
+    np.testing.assert_allclose(angle_out, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_get_angle_out_total_internal_reflection():
+    """Test VPHGrism.get_angle_out() flags totally internally reflected rays."""
+    a_in = np.linspace(start=-30, stop=30, num=61)
+    l = np.linspace(start=1600, stop=1700, num=10)
+    params = dict(a_in=a_in, n_1=1.52, n_2=1.0, n_3=1.3, m=1, a=45, v=3e4, l=l)
+
+    angle_out = diffractors.VPHGrism(**params).get_angle_out()
+
+    expected = angle_out_reference(**params)
+    assert np.isnan(expected).any() and not np.isnan(expected).all()
+    np.testing.assert_allclose(
+        angle_out, expected, rtol=1e-12, atol=1e-12, equal_nan=True
+    )
+
+
+def test_get_angle_out_evanescent():
+    """Test VPHGrism.get_angle_out() flags evanescent diffraction orders."""
+    # index matched and without an apex, so only the grating can drop a ray
+    v = np.linspace(start=3e5, stop=1.5e6, num=50)
+    l = np.linspace(start=1600, stop=1700, num=10)
+    params = dict(a_in=20, n_1=1.52, n_2=1.52, n_3=1.52, m=1, a=0, v=v, l=l)
+
+    angle_out = diffractors.VPHGrism(**params).get_angle_out()
+
+    expected = angle_out_reference(**params)
+    assert np.isnan(expected).any() and not np.isnan(expected).all()
+    np.testing.assert_allclose(
+        angle_out, expected, rtol=1e-12, atol=1e-12, equal_nan=True
+    )
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork start method is unavailable.",
+)
+def test_get_angle_out_forked():
+    """Test VPHGrism.get_angle_out() in workers forked after it was called, with
+    the fork-safe threading layer recommended for such sweeps."""
+    script = textwrap.dedent(
+        """
+        import multiprocessing
+
+        import numpy as np
+
+        from tests.test_components.test_diffractors import test_VPHGrism
+
+        a_in = [0, 5, 10, 15]
+        expected = [test_VPHGrism.get_angle_out(x) for x in a_in]
+
+        with multiprocessing.get_context("fork").Pool(processes=2) as pool:
+            angle_out = pool.map(test_VPHGrism.get_angle_out, a_in)
+
+        np.testing.assert_array_equal(angle_out, expected)
+        """
+    )
+    env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue")
+
+    # a worker that dies or deadlocks in the kernel never returns its result
+    subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, env=env, check=True, timeout=120
+    )
+
+
+@pytest.mark.skipif(
+    numba.config.THREADING_LAYER == "workqueue",
+    reason="workqueue threading layer is not thread-safe.",
+)
+def test_get_angle_out_threaded():
+    """Test VPHGrism.get_angle_out() called from several threads at once."""
+    a_in = [0, 5, 10, 15]
+    expected = [get_angle_out(x) for x in a_in]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        angle_out = list(executor.map(get_angle_out, a_in))
+
+    np.testing.assert_array_equal(angle_out, expected)
+
+
+def test_get_angle_out_caller_array_modified():
+    """Test VPHGrism.get_angle_out() is unaffected by in-place edits of the arrays
+    it was given."""
+    l = np.linspace(start=1600, stop=1700, num=100)
+    grism = diffractors.VPHGrism(
+        a_in=0, n_1=1.0, n_2=1.52, n_3=1.3, m=1, a=45, v=3e4, l=l
+    )
+    expected = grism.get_angle_out()
+
+    l[:] = 1500
+
+    assert grism.l[0] == 1600
+    np.testing.assert_array_equal(grism.get_angle_out(), expected)
+    with pytest.raises(ValueError):
+        grism.l[:] = 1500
+
+
+def test_get_angle_out_a_in_modified():
+    """Test VPHGrism.get_angle_out() is unaffected by in-place edits of the ray
+    parameters it was given."""
+    a_in = np.array([0.0, 5.0, 10.0])
+    l = np.linspace(start=1600, stop=1700, num=100)
+    grism = diffractors.VPHGrism(
+        a_in=a_in, n_1=1.0, n_2=1.52, n_3=1.3, m=1, a=45, v=3e4, l=l
+    )
+    expected = grism.get_angle_out()
+
+    a_in[:] = [20, 25, 30]
+
+    assert grism.a_in[0] == 0
+    np.testing.assert_array_equal(grism.get_angle_out(), expected)
+    with pytest.raises(ValueError):
+        grism.a_in[:] = [20, 25, 30]
+
+    grism.a_in = a_in
+    fresh = diffractors.VPHGrism(
+        a_in=a_in, n_1=1.0, n_2=1.52, n_3=1.3, m=1, a=45, v=3e4, l=l
+    )
+
+    np.testing.assert_array_equal(grism.get_angle_out(), fresh.get_angle_out())
+
+
 def test_get_undeviated_wavelength():
     """Test VPHGrism.get_undeviated_wavelength()."""
     # parameter definition - fill in with real values later
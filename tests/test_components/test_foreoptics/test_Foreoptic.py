@@ -96,6 +96,22 @@ def test_get_numerical_aperture():
     assert na == pytest.approx(1 / 2)
 
 
+def test_get_numerical_aperture_from_f_number():
+    """Test Foreoptic.get_numerical_aperture() from the f-number."""
+
+    # parameters
+    n = 5
+
+    # component instantiation
+    foreoptic = foreoptics.Foreoptic(n=n)
+
+    # evaluation
+    na = foreoptic.get_numerical_aperture()
+    LOG.info(f"Numerical aperture: {na}")
+
+    assert na == pytest.approx(1 / 10)
+
+
 def test_get_geometric_etendue():
     """Test Foreoptic.get_geometric_etendue()."""
 
@@ -54,3 +54,67 @@ def test_effective_focal_length():
     LOG.info(f"Effective focal length: {fleq}")
 
     assert fleq == pytest.approx(-200 / 3)
+
+
+def test_batch_focal_length_1():
+    """Test AchromLensBatch.focal_length_1() against AchromLens."""
+
+    f_eq = [50, 60, 70]
+    V_1 = 0.016
+    V_2 = 0.028
+
+    batch = lenses.AchromLensBatch(f_eq=f_eq, V_1=V_1, V_2=V_2)
+
+    fl1 = batch.focal_length_1()
+    LOG.info(f"Focal lengths 1: {fl1}")
+
+    ans = [
+        lenses.AchromLens(f_eq=f_eq_i, V_1=V_1, V_2=V_2).focal_length_1()
+        for f_eq_i in f_eq
+    ]
+
+    assert batch.N == len(f_eq)
+    assert fl1 == pytest.approx(ans)
+
+
+def test_batch_focal_length_2():
+    """Test AchromLensBatch.focal_length_2() against AchromLens."""
+
+    f_eq = [50, 60, 70]
+    V_1 = 0.016
+    V_2 = 0.028
+
+    batch = lenses.AchromLensBatch(f_eq=f_eq, V_1=V_1, V_2=V_2)
+
+    fl2 = batch.focal_length_2()
+    LOG.info(f"Focal lengths 2: {fl2}")
+
+    ans = [
+        lenses.AchromLens(f_eq=f_eq_i, V_1=V_1, V_2=V_2).focal_length_2()
+        for f_eq_i in f_eq
+    ]
+
+    assert batch.N == len(f_eq)
+    assert fl2 == pytest.approx(ans)
+
+
+@pytest.mark.parametrize("element", ["f_1", "f_2"])
+def test_batch_effective_focal_length(element):
+    """Test AchromLensBatch.effective_focal_length() against AchromLens."""
+
+    f = [50, 60, 70]
+    V_1 = 0.016
+    V_2 = 0.028
+
+    batch = lenses.AchromLensBatch(**{element: f}, V_1=V_1, V_2=V_2)
+
+    fleq = batch.effective_focal_length()
+    LOG.info(f"Effective focal lengths: {fleq}")
+
+    ans = [
+        lenses.AchromLens(**{element: f_i}, V_1=V_1, V_2=V_2).effective_focal_length()
+        for f_i in f
+    ]
+
+    assert batch.N == len(f)
+    assert fleq == pytest.approx(ans)
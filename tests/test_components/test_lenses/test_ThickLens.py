@@ -117,3 +117,53 @@ def test_get_collimator_emergent_ray_angle():
     LOG.info(f"Collimator emergent ray angle: {h}")
 
     assert h == pytest.approx(np.degrees(-179 / 192))
+
+
+def test_batch_get_focal_length():
+    """Test ThickLensBatch.get_focal_length() against ThickLens."""
+
+    # parameters (in cm)
+    n = np.linspace(start=1.4, stop=1.7, num=10)
+    R1 = 20
+    R2 = -40
+    d = 1
+
+    # component instantiation
+    batch = lenses.ThickLensBatch(n=n, R1=R1, R2=R2, d=d)
+
+    # evaluation
+    f = batch.get_focal_length()
+    LOG.info(f"Effective focal lengths: {f}")
+
+    ans = [lenses.ThickLens(n=n_i, R1=R1, R2=R2, d=d).get_focal_length() for n_i in n]
+
+    assert batch.N == n.size
+    assert f == pytest.approx(ans)
+
+
+def test_batch_get_principal_planes():
+    """Test ThickLensBatch.get_principal_planes() against ThickLens."""
+
+    # parameters (in cm)
+    n = np.linspace(start=1.4, stop=1.7, num=10)
+    R1 = 20
+    R2 = -40
+    d = 1
+    f_thick = lenses.ThickLensBatch(n=n, R1=R1, R2=R2, d=d).get_focal_length()
+
+    # component instantiation
+    batch = lenses.ThickLensBatch(n=n, R1=R1, R2=R2, d=d, f_thick=f_thick)
+
+    # evaluation
+    h1, h2 = batch.get_principal_planes()
+    LOG.info(f"Principal planes: {h1}, {h2}")
+
+    ans = [
+        lenses.ThickLens(n=n_i, R1=R1, R2=R2, d=d, f_thick=f_i).get_principal_planes()
+        for n_i, f_i in zip(n, f_thick)
+    ]
+    h1_ans, h2_ans = zip(*ans)
+
+    assert batch.N == n.size
+    assert h1 == pytest.approx(h1_ans)
+    assert h2 == pytest.approx(h2_ans)
@@ -29,6 +29,23 @@ def test_get_horizontal_field_of_view():
     assert fov == pytest.approx(360 * np.arctan(1 / 140) / np.pi)
 
 
+def test_get_horizontal_field_of_view_vectorized():
+    """Test ThinFocuser.get_horizontal_field_of_view() in vectorized mode."""
+
+    # parameters
+    l_s = np.array([1, 2, 3])
+    f = 70
+
+    # component instantiation
+    slit = slits.Slit(l_s=l_s, f=f)
+
+    # evaluation
+    fov = slit.get_horizontal_field_of_view()
+    LOG.info(f"Horizontal field of view: {fov}")
+
+    assert fov == pytest.approx(360 * np.arctan(l_s / 140) / np.pi)
+
+
 def test_get_vertical_field_of_view():
     """Test ThinFocuser.get_vertical_field_of_view()."""
 
@@ -0,0 +1,43 @@
+"""Tests for the physlib library."""
+
+# stdlib
+import logging
+
+# external
+import numpy as np
+import pytest
+
+# project
+from payload_designer.libs import physlib
+
+LOG = logging.getLogger(__name__)
+
+
+def test_snell_sin_2():
+    """Test physlib.snell_sin_2() against physlib.snell_angle_2()."""
+    angle_1 = np.radians(np.linspace(start=-80, stop=80, num=50))
+    n_1 = 1.0
+    n_2 = 1.52
+
+    sin_2 = physlib.snell_sin_2(sin_1=np.sin(angle_1), n_1=n_1, n_2=n_2)
+    angle_2 = physlib.snell_angle_2(angle_1=angle_1, n_1=n_1, n_2=n_2)
+    LOG.debug(f"sin(angle_2):\n{sin_2}")
+
+    assert sin_2 == pytest.approx(np.sin(angle_2))
+
+
+def test_snell_sin_2_total_internal_reflection():
+    """Test physlib.snell_sin_2() past the critical angle."""
+    sin_2 = physlib.snell_sin_2(sin_1=np.sin(np.radians(60)), n_1=1.52, n_2=1.0)
+
+    assert np.isnan(sin_2)
+
+
+def test_snell_sin_2_scalar():
+    """Test physlib.snell_sin_2() returns a scalar for a scalar input."""
+    sin_2 = physlib.snell_sin_2(sin_1=0.5, n_1=1.0, n_2=1.52)
+
+    assert np.isscalar(sin_2)
+    assert sin_2 == pytest.approx(
+        np.sin(physlib.snell_angle_2(np.arcsin(0.5), 1.0, 1.52))
+    )
@@ -0,0 +1,14 @@
+"""Tests for the precompile library."""
+
+# stdlib
+import logging
+
+# project
+from payload_designer.libs import precompile
+
+LOG = logging.getLogger(__name__)
+
+
+def test_precompile():
+    """Test precompile.precompile()."""
+    precompile.precompile()
@@ -1,6 +1,7 @@
 """Tests for the utillib library."""
 
 # stdlib
+import io
 import logging
 from pathlib import Path
 
@@ -26,3 +27,55 @@ def test_LUT_call():
 
     y = lut(x)
     LOG.debug(f"Output y:\n{y}")
+
+
+def test_LUT_shared_data():
+    """Test that LUTs loaded from the same file are scaled independently."""
+    lut_data = Path("data/test_LUT.csv")
+
+    lut_1 = utillib.LUT(lut_data)
+    lut_2 = utillib.LUT(lut_data, scale=(1, 2))
+    LOG.debug(f"LUT 1 y:\n{lut_1.y}")
+    LOG.debug(f"LUT 2 y:\n{lut_2.y}")
+
+    assert np.array_equal(lut_2.x, lut_1.x)
+    assert np.array_equal(lut_2.y, 2 * lut_1.y)
+
+
+def test_LUT_relative_path(tmp_path, monkeypatch):
+    """Test that LUTs loaded from the same relative path in different directories
+    read their own files."""
+    for scl, directory in enumerate(["a", "b"], start=1):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "lut.csv").write_text(f"1,{scl}\n2,{2 * scl}\n")
+
+    monkeypatch.chdir(tmp_path / "a")
+    lut_a = utillib.LUT("lut.csv")
+    monkeypatch.chdir(tmp_path / "b")
+    lut_b = utillib.LUT("lut.csv")
+
+    assert np.array_equal(lut_b.y, 2 * lut_a.y)
+
+
+def test_LUT_file_like():
+    """Test LUTs loaded from a file-like object and a list of lines."""
+    lines = ["1,10", "2,20"]
+
+    lut_file = utillib.LUT(io.StringIO("\n".join(lines)))
+    lut_lines = utillib.LUT(lines)
+
+    assert np.array_equal(lut_file.y, [10, 20])
+    assert np.array_equal(lut_lines.y, [10, 20])
+
+
+def test_frozen_copy():
+    """Test utillib.frozen_copy()."""
+    x = [1, 2, 3]
+
+    x_frozen = utillib.frozen_copy(x)
+    x[0] = 0
+
+    assert np.array_equal(x_frozen, [1, 2, 3])
+    assert not x_frozen.flags.writeable
+    assert utillib.frozen_copy(1.5) == 1.5
+    assert utillib.frozen_copy(None) is None